@@ -3,17 +3,31 @@ from __future__ import annotations
 import ipywidgets as widgets
 from ipywidgets import Button, Box, Layout, Textarea
 from IPython.display import display, HTML
-from huggingface_hub import HfApi
+from huggingface_hub import HfApi, get_token
+from huggingface_hub.hf_api import DatasetInfo
+from huggingface_hub.errors import HfHubHTTPError
 import requests
+from requests.adapters import HTTPAdapter
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from datetime import datetime
+from html import escape as _esc
+from itertools import islice
 from typing import List, Dict, Any
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 class ButtonBox:
     def _clicker(self, b):
-        self.position, self.button = [(i, but) for i, but in enumerate(self.buttons) if b == but][0]
-        self.unselect()
-        self.buttons[self.position].style = {'button_color': self.color}
+        # restyle only the previous and the new selection, not every button
+        self.unselect_one()
+        self.position, self.button = self._index[id(b)], b
+        b.style = {'button_color': self.color}
         if self.clicker:
             self.clicker(self)
 
@@ -24,12 +38,46 @@ class ButtonBox:
             tooltip=f'{description}',
         )
         self.buttons.append(b)
-        self.box.children = [*self.box.children, b]
+        self._index[id(b)] = len(self.buttons) - 1
+        self.box.children = self._children()
         if select:
-            self.button, self.position = b, len(self.buttons) - 1
             self._clicker(b)
         b.on_click(self._clicker)
 
+    def extend(self, descriptions, tooltips=None):
+        # bulk append: build all buttons first, then sync the box children once
+        new = [
+            Button(
+                description=d if len(d) <= self.maxchar else f'{d[:(self.maxchar-3)]}...',
+                layout=Layout(width='auto', height='21px'),
+                tooltip=tooltips[i] if tooltips else f'{d}',
+            )
+            for i, d in enumerate(descriptions)
+        ]
+        for i, b in enumerate(new, len(self.buttons)):
+            b.on_click(self._clicker)
+            self._index[id(b)] = i
+        self.buttons.extend(new)
+        self.box.children = self._children()
+
+    def populate(self, descriptions, tooltips=None):
+        # replace all buttons, but only create widgets for the first page
+        self.buttons, self._index = [], {}
+        self.button, self.position = None, -1
+        self._descs, self._tooltips, self._cursor = list(descriptions), tooltips, 0
+        self.show_more()
+
+    def show_more(self, _=None):
+        start, end = self._cursor, self._cursor + self.page_size
+        self._cursor = min(end, len(self._descs))
+        self.extend(self._descs[start:end], self._tooltips[start:end] if self._tooltips else None)
+
+    def _children(self):
+        # trailing "Show more" button while populated descriptions are still pending
+        if self._cursor < len(self._descs):
+            return (*self.buttons, self._more)
+        return tuple(self.buttons)
+
     def remove(self, position=None):
         if position is None:
             position = self.position
@@ -37,15 +85,24 @@ class ButtonBox:
             return
         self.box.children = [*self.box.children[:position], *self.box.children[position+1:]]
         self.buttons = [*self.buttons[:position], *self.buttons[position+1:]]
+        self._index = {id(b): i for i, b in enumerate(self.buttons)}
         self.button, self.position = None, -1
 
+    def unselect_one(self):
+        if self.button is not None:
+            self.button.style = {'button_color': None}
+
     def unselect(self):
         for b in self.buttons:
             b.style = {'button_color': None}
 
-    def __init__(self, descriptions, clicker=None, maxchar=60, color='powderblue'):
+    def __init__(self, descriptions, clicker=None, maxchar=60, color='powderblue', page_size=50):
         self.descriptions = descriptions if len(descriptions) == len(set(descriptions)) else list(set(descriptions))
         self.clicker, self.maxchar, self.color, self.position, self.button = clicker, maxchar, color, -1, None
+        # lazily materialized descriptions (see populate / show_more)
+        self.page_size, self._descs, self._tooltips, self._cursor = page_size, [], None, 0
+        self._more = Button(description='Show more', layout=Layout(width='auto', height='21px'), button_style='info')
+        self._more.on_click(self.show_more)
         self.buttons = [
             Button(
                 description=i if len(i) <= maxchar else f'{i[:(maxchar-3)]}...',
@@ -54,6 +111,8 @@ class ButtonBox:
             )
             for i in descriptions
         ]
+        # id(button) -> position, so clicks don't scan the list
+        self._index = {id(b): i for i, b in enumerate(self.buttons)}
         self.box = Box(layout=Layout(display='flex', flex_flow='wrap'), children=self.buttons)
         for button in self.buttons:
             button.on_click(self._clicker)
@@ -70,17 +129,19 @@ def _normalize_list(val):
     return []
 
 def _lower_flatten(items):
-    out = []
-    for x in items:
-        if isinstance(x, dict):
-            for v in x.values():
-                if isinstance(v, str):
-                    out.append(v.lower())
-        elif isinstance(x, list):
-            out.extend([str(y).lower() for y in x])
-        else:
-            out.append(str(x).lower())
-    return list({*out})
+    def gen():
+        for x in items:
+            if isinstance(x, dict):
+                for v in x.values():
+                    if isinstance(v, str):
+                        yield v.lower()
+            elif isinstance(x, list):
+                for y in x:
+                    yield str(y).lower()
+            else:
+                yield str(x).lower()
+    # single-pass, order-preserving dedup
+    return list(dict.fromkeys(gen()))
 
 def extract_tasks(card):
     c = card or {}
@@ -90,63 +151,107 @@ def extract_languages(card):
     c = card or {}
     return _lower_flatten(_normalize_list(c.get('language') or c.get('languages') or c.get('langs')))
 
-@lru_cache(maxsize=2048)
+_API = HfApi()
+
+# one keep-alive connection pool for all direct calls to huggingface.co
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_SESSION.headers['Accept-Encoding'] = 'gzip, deflate'
+_TOKEN = get_token()
+if _TOKEN:
+    _SESSION.headers['Authorization'] = f'Bearer {_TOKEN}'
+
+def _hf_dataset_info(repo_id: str):
+    resp = _SESSION.get(f'https://huggingface.co/api/datasets/{repo_id}', timeout=20)
+    resp.raise_for_status()
+    return DatasetInfo(**_json.loads(resp.content))
+
+# repo_id -> (fetched_at, info); entries expire after _INFO_TTL seconds, oldest evicted first
+_INFO_CACHE: Dict[str, tuple] = {}
+_INFO_TTL = 600
+_INFO_MAXSIZE = 2048
+_INFO_LOCK = threading.Lock()
+
 def cached_dataset_info(repo_id: str):
-    api = HfApi()
-    return api.dataset_info(repo_id)
+    now = time.monotonic()
+    hit = _INFO_CACHE.get(repo_id)
+    if hit and now - hit[0] < _INFO_TTL:
+        return hit[1]
+    info = _hf_dataset_info(repo_id)
+    _store_info(repo_id, info, now)
+    return info
+
+def _store_info(repo_id, info, now=None):
+    with _INFO_LOCK:
+        _INFO_CACHE.pop(repo_id, None)
+        _INFO_CACHE[repo_id] = (time.monotonic() if now is None else now, info)
+        while len(_INFO_CACHE) > _INFO_MAXSIZE:
+            _INFO_CACHE.pop(next(iter(_INFO_CACHE)))
+
+# HTTP status and network failures from the hub; HfHubHTTPError's base is the HTTP
+# client's root error (httpx or requests, depending on the huggingface_hub version)
+_HUB_ERRORS = (HfHubHTTPError.__base__, OSError, ValueError)
+
+# caps concurrent requests to huggingface.co across all worker pools
+_HF_SEMAPHORE = threading.BoundedSemaphore(32)
+
+def _retry_delay(resp, attempt):
+    headers = getattr(resp, 'headers', None) or {}
+    for key in ('Retry-After', 'x-ratelimit-reset'):
+        try:
+            return min(float(headers[key]), 30.0)
+        except (KeyError, TypeError, ValueError):
+            pass
+    return 0.5 * 2 ** attempt
+
+def _safe_info(repo_id, retries=3):
+    for attempt in range(retries + 1):
+        try:
+            with _HF_SEMAPHORE:
+                return cached_dataset_info(repo_id)
+        except Exception as e:
+            resp = getattr(e, 'response', None)
+            status_code = getattr(resp, 'status_code', None)
+            if status_code not in (429, 502, 503, 504) or attempt == retries:
+                return None
+            time.sleep(_retry_delay(resp, attempt))
+    return None
+
+def _fetch_many(ids):
+    # I/O bound: fan the per-id lookups out over a thread pool, keeping input order
+    if not ids:
+        return []
+    with ThreadPoolExecutor(max_workers=min(32, len(ids))) as ex:
+        return list(ex.map(_safe_info, ids))
 
 def build_dataset_record(info):
     card = getattr(info, 'cardData', None)
     tasks = extract_tasks(card)
     langs = extract_languages(card)
+    pretty = (card or {}).get('pretty_name') or ''
     record = {
         'id': info.id,
+        'id_l': info.id.lower(),
+        'pretty_l': str(pretty).lower(),
         'downloads': getattr(info, 'downloads', None),
         'likes': getattr(info, 'likes', None),
         'last_modified': getattr(info, 'lastModified', None),
         'card': card,
-        'tasks': tasks,
-        'languages': langs,
+        'tasks': frozenset(tasks),
+        'languages': frozenset(langs),
         'license': (card or {}).get('license'),
     }
     return record
 
-def list_all_time(limit=50, search_text='', task='Any', language='Any', require_license=False, require_carddata=False, backend_limit=500):
-    api = HfApi()
-    lst = api.list_datasets(sort='downloads', direction=-1, limit=backend_limit, full=True)
-    records = []
-    search = (search_text or '').strip().lower()
-    for info in lst:
-        rec = build_dataset_record(info)
-        if search:
-            pretty = (rec['card'] or {}).get('pretty_name') or ''
-            if search not in rec['id'].lower() and search not in str(pretty).lower():
-                continue
-        if task != 'Any' and task.lower() not in rec['tasks']:
-            continue
-        if language != 'Any':
-            if language == 'multi':
-                if not (len(rec['languages']) > 1 or 'multilingual' in rec['languages']):
-                    continue
-            else:
-                if language.lower() not in rec['languages']:
-                    continue
-        if require_license and not rec['license']:
-            continue
-        # require_carddata
-        if require_carddata and not rec['card']:
-            continue
-        records.append(rec)
-        if len(records) >= limit:
-            break
-    return records
+# metric key -> raw (unfiltered) records fetched for it; filters are applied in memory
+_raw_cache: Dict[str, List[Dict[str, Any]]] = {}
 
-def list_trending(period='week', limit=50, search_text='', task='Any', language='Any', require_license=False, require_carddata=False):
+def _fetch_trending_ids(period):
     url = f'https://huggingface.co/api/trending/datasets?period={period}'
     try:
-        resp = requests.get(url, timeout=20)
+        resp = _SESSION.get(url, timeout=20)
         resp.raise_for_status()
-        data = resp.json()
+        data = _json.loads(resp.content)
     except Exception:
         return []
     ids = []
@@ -154,68 +259,153 @@ def list_trending(period='week', limit=50, search_text='', task='Any', language=
         rid = item.get('repoId') or item.get('id') or item.get('name')
         if rid:
             ids.append(rid)
-    records = []
-    search = (search_text or '').strip().lower()
-    for rid in ids:
+    return ids
+
+def _fetch_raw(metric, backend_limit=500):
+    # metric: 'all' (all-time downloads) or a trending period ('week', 'month')
+    if metric == 'all':
+        lst = _API.list_datasets(sort='downloads', limit=backend_limit, full=True)
+        return [build_dataset_record(info) for info in lst]
+    return [build_dataset_record(info) for info in _fetch_infos(_fetch_trending_ids(metric))]
+
+def _fetch_infos(ids):
+    # one paginated listing by trending score covers most trending ids in a single request;
+    # ids it misses (other period, private or removed repos) fall back to per-id lookups
+    wanted = set(ids)
+    by_id = {}
+    if ids:
         try:
-            info = cached_dataset_info(rid)
-        except Exception:
-            continue
-        rec = build_dataset_record(info)
-        if search:
-            pretty = (rec['card'] or {}).get('pretty_name') or ''
-            if search not in rec['id'].lower() and search not in str(pretty).lower():
-                continue
-        if task != 'Any' and task.lower() not in rec['tasks']:
-            continue
-        if language != 'Any':
-            if language == 'multi':
-                if not (len(rec['languages']) > 1 or 'multilingual' in rec['languages']):
-                    continue
-            else:
-                if language.lower() not in rec['languages']:
-                    continue
-        if require_license and not rec['license']:
-            continue
-        if require_carddata and not rec['card']:
-            continue
-        records.append(rec)
-        if len(records) >= limit:
-            break
+            for info in _API.list_datasets(sort='trending_score', limit=2 * len(ids), full=True):
+                if info.id in wanted:
+                    by_id[info.id] = info
+                    _store_info(info.id, info)
+                    if len(by_id) == len(wanted):
+                        break
+        except _HUB_ERRORS:
+            pass
+    missing = [rid for rid in ids if rid not in by_id]
+    for rid, info in zip(missing, _fetch_many(missing)):
+        if info is not None:
+            by_id[rid] = info
+    return [by_id[rid] for rid in ids if rid in by_id]
+
+def _get_raw(metric, limit, backend_limit=500, force=False):
+    cached = _raw_cache.get(metric)
+    # the trending endpoint returns its whole list at once, so only all-time can grow
+    if force or cached is None or (metric == 'all' and limit > len(cached)):
+        cached = _fetch_raw(metric, max(backend_limit, limit))
+        _raw_cache[metric] = cached
+    return cached
+
+@lru_cache(maxsize=64)
+def _make_filter(search_l, task_l, lang_l, want_multi, req_lic, req_card):
+    # generate a predicate containing only the enabled checks, with the UI values as literals
+    src = ["def f(r):"]
+    if search_l:
+        src.append(f"  if {search_l!r} not in r['id_l'] and {search_l!r} not in r['pretty_l']: return False")
+    if task_l:
+        src.append(f"  if {task_l!r} not in r['tasks']: return False")
+    if want_multi:
+        src.append("  if not (len(r['languages']) > 1 or 'multilingual' in r['languages']): return False")
+    elif lang_l:
+        src.append(f"  if {lang_l!r} not in r['languages']: return False")
+    if req_lic:
+        src.append("  if not r['license']: return False")
+    if req_card:
+        src.append("  if not r['card']: return False")
+    src.append("  return True")
+    ns = {}
+    exec("\n".join(src), ns)
+    return ns['f']
+
+def _apply_filters(records, limit=50, search_text='', task='Any', language='Any', require_license=False, require_carddata=False):
+    # loop-invariant predicates, normalized once per call
+    search_l = (search_text or '').strip().lower() or None
+    task_l = None if task == 'Any' else task.lower()
+    want_multi = language == 'multi'
+    lang_l = None if language == 'Any' or want_multi else language.lower()
+    accept = _make_filter(search_l, task_l, lang_l, want_multi, bool(require_license), bool(require_carddata))
+    return list(islice(filter(accept, records), limit))
+
+def _select_records(metric, limit, filters=(), force=False, max_scanned=2000, page_size=100):
+    # all-time: fetch about one page of the ranking and grow it (via _get_raw) only while
+    # the filters leave fewer than `limit` matches; max_scanned bounds very selective filters
+    n = max(limit, page_size) if metric == 'all' else limit
+    raw = _get_raw(metric, n, backend_limit=n, force=force)
+    records = _apply_filters(raw, limit, *filters)
+    while metric == 'all' and len(records) < limit and len(raw) >= n and n < max_scanned:
+        n = min(2 * n, max_scanned)
+        raw = _get_raw(metric, n, backend_limit=n)
+        records = _apply_filters(raw, limit, *filters)
     return records
 
+def list_all_time(limit=50, search_text='', task='Any', language='Any', require_license=False, require_carddata=False, max_scanned=2000, batch_size=100):
+    filters = (search_text, task, language, require_license, require_carddata)
+    return _select_records('all', limit, filters, max_scanned=max_scanned, page_size=batch_size)
+
+def list_trending(period='week', limit=50, search_text='', task='Any', language='Any', require_license=False, require_carddata=False):
+    records = _fetch_raw(period)
+    return _apply_filters(records, limit, search_text, task, language, require_license, require_carddata)
+
 def html_escape(s):
-    import html
-    return html.escape(str(s), quote=True)
+    return _esc(str(s), quote=True)
+
+# dataset id -> (record, html); the record identity check drops entries from older fetches
+_DETAILS_CACHE: Dict[str, tuple] = {}
+_DETAILS_MAXSIZE = 256
 
 def render_details(rec):
+    hit = _DETAILS_CACHE.get(rec['id'])
+    if hit and hit[0] is rec:
+        return hit[1]
     card = rec.get('card') or {}
     pretty = card.get('pretty_name') or rec['id']
     summary = card.get('dataset_summary') or card.get('description') or ''
     if isinstance(summary, list):
         summary = ' '.join([str(x) for x in summary])
+    # slice before escaping so html.escape never walks a huge card summary
+    too_long = len(summary) > 500
+    escaped_summary = html_escape(summary[:500]) + ('...' if too_long else '')
+    pretty = str(pretty)
+    escaped_pretty = html_escape(pretty[:200]) + ('...' if len(pretty) > 200 else '')
     hub_url = f"https://huggingface.co/datasets/{rec['id']}"
     # languages and tasks
-    languages = ', '.join(rec['languages']) if rec['languages'] else 'n/a'
-    tasks = ', '.join(rec['tasks']) if rec['tasks'] else 'n/a'
+    languages = ', '.join(sorted(rec['languages'])) if rec['languages'] else 'n/a'
+    tasks = ', '.join(sorted(rec['tasks'])) if rec['tasks'] else 'n/a'
     likes = rec.get('likes')
     downloads = rec.get('downloads')
     last_mod = rec.get('last_modified')
     last_mod_str = last_mod.strftime('%Y-%m-%d %H:%M') if hasattr(last_mod, 'strftime') else str(last_mod or 'n/a')
-    html_block = (
-        "<div style='font-family:system-ui;line-height:1.4'>\n"
-        f"<h3 style='margin:0 0 6px 0'>{html_escape(pretty)} <small style='color:#666'>({html_escape(rec['id'])})</small></h3>\n"
-        f"<p style='margin:0 0 6px 0;color:#333'>{html_escape(summary)[:500]}{'...' if summary and len(summary)>500 else ''}</p>\n"
-        f"<p style='margin:0 0 6px 0'><b>Downloads:</b> {downloads if downloads is not None else 'n/a'} &nbsp; <b>Likes:</b> {likes if likes is not None else 'n/a'} &nbsp; <b>Last modified:</b> {html_escape(last_mod_str)}</p>\n"
-        f"<p style='margin:0 0 6px 0'><b>Languages:</b> {html_escape(languages)} &nbsp; <b>Tasks:</b> {html_escape(tasks)} &nbsp; <b>License:</b> {html_escape(card.get('license','n/a'))}</p>\n"
-        f"<p><a href='{hub_url}' target='_blank'>Open on Hugging Face →</a></p>\n"
-        "</div>"
-    )
+    parts = [
+        "<div style='font-family:system-ui;line-height:1.4'>\n",
+        "<h3 style='margin:0 0 6px 0'>", escaped_pretty,
+        " <small style='color:#666'>(", html_escape(rec['id']), ")</small></h3>\n",
+        "<p style='margin:0 0 6px 0;color:#333'>", escaped_summary, "</p>\n",
+        "<p style='margin:0 0 6px 0'><b>Downloads:</b> ", str(downloads if downloads is not None else 'n/a'),
+        " &nbsp; <b>Likes:</b> ", str(likes if likes is not None else 'n/a'),
+        " &nbsp; <b>Last modified:</b> ", html_escape(last_mod_str), "</p>\n",
+        "<p style='margin:0 0 6px 0'><b>Languages:</b> ", html_escape(languages),
+        " &nbsp; <b>Tasks:</b> ", html_escape(tasks),
+        " &nbsp; <b>License:</b> ", html_escape(card.get('license', 'n/a')), "</p>\n",
+        "<p><a href='", hub_url, "' target='_blank'>Open on Hugging Face →</a></p>\n",
+        "</div>",
+    ]
+    html_block = ''.join(parts)
+    _DETAILS_CACHE.pop(rec['id'], None)
+    _DETAILS_CACHE[rec['id']] = (rec, html_block)
+    if len(_DETAILS_CACHE) > _DETAILS_MAXSIZE:
+        _DETAILS_CACHE.pop(next(iter(_DETAILS_CACHE)))
     return html_block
 
+_METRICS = {
+    'All-time downloads': 'all',
+    'Trending (week)': 'week',
+    'Trending (month)': 'month',
+}
+
 def render_ui():
     metric = widgets.ToggleButtons(
-        options=['All-time downloads', 'Trending (week)', 'Trending (month)'],
+        options=list(_METRICS),
         value='All-time downloads',
         description='Metric:',
     )
@@ -247,15 +437,34 @@ def render_ui():
     _current_records = {}
 
     def populate_buttons(records):
-        buttonbox.box.children = ()
-        buttonbox.buttons = []
-        for rec in records:
-            title = (rec.get('card') or {}).get('pretty_name') or rec['id']
-            desc = f'{title}'
-            buttonbox.append(desc, select=False)
-            buttonbox.buttons[-1].tooltip = rec['id']
-
-    def refresh(_=None):
+        buttonbox.populate(
+            [f"{(rec.get('card') or {}).get('pretty_name') or rec['id']}" for rec in records],
+            [rec['id'] for rec in records],
+        )
+
+    # debounce widget changes: only the latest of a burst of events triggers a refresh.
+    # Every refresh takes a token; one that is superseded while fetching drops its result
+    _debounce = {'token': 0, 'timer': None}
+    _render_lock = threading.Lock()
+
+    def schedule_refresh(change=None, delay=0.2):
+        _debounce['token'] += 1
+        token = _debounce['token']
+        if _debounce['timer'] is not None:
+            _debounce['timer'].cancel()
+
+        def fire():
+            if token == _debounce['token']:
+                refresh(token=token)
+
+        _debounce['timer'] = threading.Timer(delay, fire)
+        _debounce['timer'].start()
+
+    def refresh(_=None, force=False, token=None):
+        if token is None:
+            # direct call (initial load, Refresh button): supersede anything in flight
+            _debounce['token'] += 1
+            token = _debounce['token']
         status.value = 'Loading…'
         details.value = ''
         metric_val = metric.value
@@ -265,17 +474,22 @@ def render_ui():
         lang = lang_dd.value
         require_license = lic_cb.value
         require_card = card_cb.value
-        if metric_val == 'All-time downloads':
-            records = list_all_time(limit, search, task, lang, require_license, require_card)
-        elif metric_val == 'Trending (week)':
-            records = list_trending('week', limit, search, task, lang, require_license, require_card)
-        else:
-            records = list_trending('month', limit, search, task, lang, require_license, require_card)
-        _current_records.clear()
-        for r in records:
-            _current_records[r['id']] = r
-        populate_buttons(records)
-        status.value = f'Showing {len(records)} datasets for “{metric_val}”. Click a button to see details.'
+        try:
+            filters = (search, task, lang, require_license, require_card)
+            records = _select_records(_METRICS[metric_val], limit, filters, force=force)
+        except Exception as e:
+            # timer threads would swallow the error and leave 'Loading…' behind
+            if token == _debounce['token']:
+                status.value = f'<span style="color:#b00">Error loading datasets: {_esc(str(e))}</span>'
+            return
+        with _render_lock:
+            if token != _debounce['token']:
+                return  # a newer refresh started meanwhile; don't overwrite its result
+            _current_records.clear()
+            for r in records:
+                _current_records[r['id']] = r
+            populate_buttons(records)
+            status.value = f'Showing {len(records)} datasets for “{metric_val}”. Click a button to see details.'
 
     def on_select(bbox):
         try:
@@ -288,9 +502,9 @@ def render_ui():
         except Exception as e:
             details.value = f'<pre>{e}</pre>'
 
-    refresh_btn.on_click(refresh)
+    refresh_btn.on_click(lambda b: refresh(force=True))
     for w in [metric, limit_slider, search_box, task_dd, lang_dd, lic_cb, card_cb]:
-        w.observe(lambda change: refresh(), names='value')
+        w.observe(schedule_refresh, names='value')
     buttonbox.clicker = on_select
 
     display(container)
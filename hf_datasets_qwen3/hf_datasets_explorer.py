@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from typing import List, Union, Optional
 from IPython.display import display, clear_output
 import json
+import time
 
 # Import the ButtonBox class from the notebook
 class ButtonBox():
@@ -96,36 +97,66 @@ def fetch_datasets(sort_by="downloads", limit=50, date_filter=None):
         "likes"
     ]
     
-    # Fetch datasets with sorting
-    datasets = list_datasets(
-        sort=sort_by,
-        direction=-1,  # Descending order
-        limit=limit,
-        expand=expand_properties
-    )
-    
-    # Convert to list for easier handling
-    datasets_list = list(datasets)
-    
-    # Apply date filtering if requested
+    # Work out the cutoff for date filtering, if requested
+    cutoff_date = None
     if date_filter and sort_by in ["last_modified", "created_at"]:
-        cutoff_date = None
         if date_filter == "week":
             cutoff_date = datetime.now() - timedelta(weeks=1)
         elif date_filter == "month":
             cutoff_date = datetime.now() - timedelta(days=30)
         elif date_filter == "year":
             cutoff_date = datetime.now() - timedelta(days=365)
-        
-        if cutoff_date:
-            date_attr = "last_modified" if sort_by == "last_modified" else "created_at"
-            datasets_list = [
-                ds for ds in datasets_list 
-                if getattr(ds, date_attr) and getattr(ds, date_attr).replace(tzinfo=None) > cutoff_date
-            ]
+    
+    if not cutoff_date:
+        # Fetch datasets with sorting
+        datasets = list_datasets(
+            sort=sort_by,  # the hub sorts descending
+            limit=limit,
+            expand=expand_properties
+        )
+        return list(datasets)
+    
+    # Results are sorted by the filtered date (newest first), so stream them
+    # and stop at the first one older than the cutoff
+    date_attr = "last_modified" if sort_by == "last_modified" else "created_at"
+    datasets_list = []
+    for ds in list_datasets(sort=sort_by, limit=None, expand=expand_properties):
+        date = getattr(ds, date_attr, None)
+        if not date:
+            continue
+        if date.replace(tzinfo=None) <= cutoff_date:
+            break
+        datasets_list.append(ds)
+        if len(datasets_list) >= limit:
+            break
     
     return datasets_list
 
+# Short-lived cache of fetch_datasets results, keyed by its arguments
+_FETCH_CACHE = {}
+
+def fetch_datasets_cached(sort_by="downloads", limit=50, date_filter=None, ttl=60):
+    """
+    Cached wrapper around fetch_datasets.
+    
+    Args:
+        sort_by (str): See fetch_datasets
+        limit (int): See fetch_datasets
+        date_filter (str): See fetch_datasets
+        ttl (float): Seconds a cached result stays valid; 0 forces a fresh fetch
+    
+    Returns:
+        list: List of DatasetInfo objects
+    """
+    key = (sort_by, limit, date_filter)
+    now = time.monotonic()
+    hit = _FETCH_CACHE.get(key)
+    if hit and now - hit[0] < ttl:
+        return hit[1]
+    val = fetch_datasets(sort_by=sort_by, limit=limit, date_filter=date_filter)
+    _FETCH_CACHE[key] = (now, val)
+    return val
+
 # Function to display dataset details
 def display_dataset_details(dataset):
     """
@@ -188,6 +219,7 @@ def create_dataset_explorer():
         max=200,
         step=10,
         description="Limit:",
+        continuous_update=False,
         style={'description_width': 'initial'}
     )
     
@@ -197,18 +229,24 @@ def create_dataset_explorer():
     # Create button box for datasets
     buttonbox = ButtonBox([])
     
+    # Datasets currently shown, by id (used for details lookups)
+    _current = {}
+    
     # Function to update dataset list
-    def update_datasets(sort_by=None, date_filter=None, limit=None):
+    def update_datasets(sort_by=None, date_filter=None, limit=None, ttl=60):
         with output_area:
             clear_output()
             print("Fetching datasets...")
             
         try:
-            datasets = fetch_datasets(
+            datasets = fetch_datasets_cached(
                 sort_by=sort_by or sort_dropdown.value,
                 limit=limit or limit_slider.value,
-                date_filter=date_filter or date_filter_dropdown.value
+                date_filter=date_filter or date_filter_dropdown.value,
+                ttl=ttl
             )
+            _current.clear()
+            _current.update({d.id: d for d in datasets})
             
             # Clear existing buttons
             buttonbox.box.children = []
@@ -239,12 +277,7 @@ def create_dataset_explorer():
             
         try:
             # Find the dataset in our list
-            datasets = fetch_datasets(sort_by=sort_dropdown.value, limit=limit_slider.value)
-            selected_dataset = None
-            for ds in datasets:
-                if ds.id == dataset_id:
-                    selected_dataset = ds
-                    break
+            selected_dataset = _current.get(dataset_id)
             
             if selected_dataset:
                 details = display_dataset_details(selected_dataset)
@@ -266,7 +299,7 @@ def create_dataset_explorer():
     
     # Event handlers
     def on_refresh_clicked(b):
-        update_datasets()
+        update_datasets(ttl=0)
     
     def on_sort_changed(change):
         update_datasets(sort_by=change['new'])
@@ -281,7 +314,7 @@ def create_dataset_explorer():
     refresh_button.on_click(on_refresh_clicked)
     sort_dropdown.observe(on_sort_changed, names='value')
     date_filter_dropdown.observe(on_date_filter_changed, names='value')
-    limit_slider.observe(on_limit_changed, names='value')
+    limit_slider.observe(on_limit_changed, names='value')  # continuous_update=False: one event per drag
     
     # Initial dataset load
     update_datasets()
@@ -8,24 +8,120 @@ Author: Assistant
 Created: 2025-08-20
 """
 
+import asyncio
+import json
+import os
+import queue
+import random
+import sqlite3
+import string
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Any, Tuple
+from dataclasses import dataclass, field, fields
+from collections import OrderedDict
 from functools import lru_cache
+from itertools import islice, product
 
 # Required imports
 try:
-    from huggingface_hub import HfApi, list_datasets, dataset_info
+    from huggingface_hub import HfApi, list_datasets, dataset_info, get_token
+    from huggingface_hub.hf_api import DatasetInfo
+    from huggingface_hub.errors import HfHubHTTPError
     from ipywidgets import widgets, Layout, HTML, VBox, HBox, Button, Box
     import requests
+    from urllib3.util.retry import Retry
     HF_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Some dependencies not available: {e}")
     HF_AVAILABLE = False
 
+# Optional: async stats fetching (falls back to a thread pool)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Optional: vectorized time filtering for larger lists
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional: cachetools for bounded expiring caches (minimal stand-in below otherwise)
+try:
+    from cachetools import TTLCache
+except ImportError:
+    class TTLCache:
+        """Minimal cachetools.TTLCache stand-in: LRU eviction plus per-entry expiry"""
+        
+        def __init__(self, maxsize, ttl):
+            self.maxsize, self.ttl = maxsize, ttl
+            self._data = OrderedDict()  # key -> (expires_at, value), oldest first
+        
+        def __getitem__(self, key):
+            expires_at, value = self._data[key]
+            if expires_at < time.monotonic():
+                del self._data[key]
+                raise KeyError(key)
+            self._data.move_to_end(key)
+            return value
+        
+        def __setitem__(self, key, value):
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        
+        def __contains__(self, key):
+            return self.get(key) is not None
+        
+        def __len__(self):
+            return len(self._data)
+        
+        def get(self, key, default=None):
+            try:
+                return self[key]
+            except KeyError:
+                return default
+        
+        def clear(self):
+            self._data.clear()
+
+HF_ENDPOINT = "https://huggingface.co"
+
+# Hub request limits: parallel requests and retries on 429/503
+MAX_CONCURRENT = 16
+MAX_RETRIES = 5
+RETRY_STATUSES = (429, 503)
+MAX_RETRY_DELAY = 60.0  # cap on any single wait; sync retries block the UI thread
+
+def _retry_delay(headers, attempt: int) -> float:
+    """Seconds to wait before a retry: the hub's Retry-After if given, else exponential backoff with jitter"""
+    try:
+        delay = float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        delay = 2 ** attempt + random.random()
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+# Dataset stats persisted across notebook restarts
+DEFAULT_DISK_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'hf_viewer', 'stats.sqlite3')
+
+def _run_async(coro):
+    """Run a coroutine from sync code, also inside Jupyter's already running event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
 # Data structures for dataset information
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatasetStats:
     """Comprehensive dataset statistics and information"""
     id: str
@@ -36,17 +132,48 @@ class DatasetStats:
     likes: int      # HF likes/stars
     created_at: datetime
     updated_at: datetime
-    tags: List[str]
+    tags: Tuple[str, ...]
     url: str
     size_bytes: Optional[int] = None
     file_count: Optional[int] = None
+    # display strings, rendered once here instead of on every refresh/click
+    download_str: str = field(init=False, repr=False, compare=False)
+    updated_str: str = field(init=False, repr=False, compare=False)
+    tags_html: str = field(init=False, repr=False, compare=False)
+    _tag_summary: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        tags = tuple(self.tags or ())
+        setattr_ = object.__setattr__
+        setattr_(self, 'tags', tags)
+        setattr_(self, 'download_str', format(self.downloads, ',d') if self.downloads > 0 else 'N/A')
+        setattr_(self, 'updated_str', self.updated_at.strftime('%Y-%m-%d') if self.updated_at else 'Unknown')
+        setattr_(self, 'tags_html', "".join([_TAG_HTML.format(tag) for tag in tags[:10]])
+                 if tags else '<span style="color: #999;">No tags available</span>')
+        setattr_(self, '_tag_summary', ', '.join(tags[:5]) if tags else 'None')
+
+def _stats_to_dict(stats: DatasetStats) -> Dict[str, Any]:
+    """JSON-serializable form of DatasetStats (datetimes as ISO strings)"""
+    data = {f.name: getattr(stats, f.name) for f in fields(stats) if f.init}
+    for key in ('created_at', 'updated_at'):
+        if data[key]:
+            data[key] = data[key].isoformat()
+    return data
+
+def _stats_from_dict(data: Dict[str, Any]) -> DatasetStats:
+    """Inverse of _stats_to_dict"""
+    data = dict(data)
+    for key in ('created_at', 'updated_at'):
+        if data.get(key):
+            data[key] = datetime.fromisoformat(data[key])
+    return DatasetStats(**data)
 
 class ButtonBox:
     """Enhanced ButtonBox class (copy from original with improvements)"""
     
     def _clicker(self, b):
-        # search clicked button and remember
-        self.position, self.button = [(i, but) for i, but in enumerate(self.buttons) if b == but][0]
+        # clicked button knows its position
+        self.position, self.button = b._bb_index, b
         
         # unselect (color) all buttons and select new
         self.unselect()
@@ -56,14 +183,18 @@ class ButtonBox:
         if self.clicker:
             self.clicker(self)
     
-    def append(self, description, select=True):
-        # add new selector button at the end
-        b = Button(
+    def _make_button(self, description, tooltip=None):
+        return Button(
             description=description if len(description) <= self.maxchar else f'{description[:(self.maxchar-3)]}...',
             layout=Layout(width='auto', height='21px'),
-            tooltip=f'{description}'
+            tooltip=tooltip or f'{description}'
         )
+    
+    def append(self, description, select=True):
+        # add new selector button at the end
+        b = self._make_button(description)
         
+        b._bb_index = len(self.buttons)
         self.buttons.append(b)
         self.box.children = [*self.box.children, b]
         
@@ -75,16 +206,32 @@ class ButtonBox:
         b.on_click(self._clicker)
         return b  # Return the button for additional customization
     
+    def extend(self, descriptions, tooltips=None, select=False):
+        """Add several buttons with a single children update (one widget sync)"""
+        new = [self._make_button(d, t) for d, t in zip(descriptions, tooltips or [None] * len(descriptions))]
+        for i, b in enumerate(new, len(self.buttons)):
+            b._bb_index = i
+            b.on_click(self._clicker)
+        self.buttons.extend(new)
+        self.box.children = tuple(self.buttons)
+        
+        # select first new button
+        if select and new:
+            self._clicker(new[0])
+        return new  # Return the buttons for additional customization
+    
     def remove(self, position=None):
         # remove selected if no position given
-        if not position:
+        if position is None:
             position = self.position
-        if not position or not position < len(self.buttons) or position < 0:
+        if position is None or not 0 <= position < len(self.buttons):
             return
         
         # clean up
         self.box.children = [*self.box.children[:position], *self.box.children[position+1:]]
         self.buttons = [*self.buttons[:position], *self.buttons[position+1:]]
+        for i, b in enumerate(self.buttons[position:], position):
+            b._bb_index = i
         self.button, self.position = None, -1
     
     def unselect(self):
@@ -104,21 +251,15 @@ class ButtonBox:
         self.clicker, self.maxchar, self.color, self.position, self.button = clicker, maxchar, color, -1, None
         
         # make buttons
-        self.buttons = [
-            Button(
-                description=i if len(i) <= maxchar else f'{i[:(maxchar-3)]}...',
-                layout=Layout(width='auto', height='21px'),
-                tooltip=f'{i}'
-            )
-            for i in descriptions
-        ]
+        self.buttons = [self._make_button(i) for i in descriptions]
         
         # put them in a box / bind event
         self.box = Box(
             layout=Layout(display='flex', flex_flow='wrap'),
             children=self.buttons
         )
-        for button in self.buttons:
+        for i, button in enumerate(self.buttons):
+            button._bb_index = i
             button.on_click(self._clicker)
 
 class FilterControls:
@@ -216,116 +357,399 @@ class FilterControls:
 class DatasetManager:
     """Manages dataset fetching, caching, and filtering"""
     
-    def __init__(self):
+    def __init__(self, concurrency_limit: int = MAX_CONCURRENT, max_retries: int = MAX_RETRIES,
+                 disk_cache_path: Optional[str] = DEFAULT_DISK_CACHE):
         if not HF_AVAILABLE:
             raise ImportError("HuggingFace Hub library not available. Please install: pip install huggingface_hub")
         
         self.api = HfApi()
-        self.cache = {}
         self.cache_timeout = 3600  # 1 hour
-        self._stats_cache = {}  # Cache for individual dataset stats
+        # Bounded caches; entries expire on access after cache_timeout
+        self.cache = TTLCache(maxsize=64, ttl=self.cache_timeout)  # Popular dataset lists
+        # Raw hub listings per sort as (rows requested, infos); each time window and
+        # any smaller limit is cut from the same listing instead of refetching it
+        self._listing_cache = TTLCache(maxsize=8, ttl=self.cache_timeout)
+        self._stats_cache = TTLCache(maxsize=512, ttl=self.cache_timeout)  # Individual dataset stats
+        self._cache_lock = threading.Lock()  # caches are shared with worker and prefetch threads
+        self.concurrency_limit = concurrency_limit  # Max parallel hub requests
+        self.max_retries = max_retries  # Retries on 429/503 responses
+        self._paused_until = 0.0  # Set when the hub reports an exhausted rate limit
+        
+        # Keep-alive session for direct hub API calls, pooled for the worker threads.
+        # Transport retries cover connection errors and 5xx; 429/503 are left to
+        # _hub_get, which honours the hub's rate-limit headers
+        self.session = requests.Session()
+        retries = Retry(total=5, backoff_factor=0.5, status_forcelist=[500, 502, 504], raise_on_status=False)
+        self.session.mount('https://', requests.adapters.HTTPAdapter(
+            pool_connections=32, pool_maxsize=32, max_retries=retries))
+        token = get_token()
+        if token:
+            self.session.headers['Authorization'] = f'Bearer {token}'
+        
+        # Persistent stats cache (SQLite, JSON rows); disabled with disk_cache_path=None
+        self.disk_cache_timeout = self.cache_timeout * 24
+        self._disk_not_before = 0.0  # rows fetched earlier are ignored (set by clear_cache)
+        self._disk = None
+        self._disk_lock = threading.Lock()
+        if disk_cache_path:
+            try:
+                os.makedirs(os.path.dirname(disk_cache_path) or '.', exist_ok=True)
+                self._disk = sqlite3.connect(disk_cache_path, check_same_thread=False)
+                self._disk.execute(
+                    "CREATE TABLE IF NOT EXISTS stats (dataset_id TEXT PRIMARY KEY, fetched_at REAL, data TEXT)"
+                )
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: disk cache disabled: {e}")
+                self._disk = None
+        
+    def _lookup_stats(self, dataset_id: str) -> Optional[DatasetStats]:
+        """Look up stats in memory, then in the disk cache"""
+        with self._cache_lock:
+            stats = self._stats_cache.get(dataset_id)
+        if stats or self._disk is None:
+            return stats
+        
+        try:
+            with self._disk_lock:
+                row = self._disk.execute(
+                    "SELECT fetched_at, data FROM stats WHERE dataset_id = ?", (dataset_id,)
+                ).fetchone()
+            if not row or row[0] < self._disk_not_before or time.time() - row[0] >= self.disk_cache_timeout:
+                return None
+            stats = _stats_from_dict(json.loads(row[1]))
+        except (sqlite3.Error, ValueError, TypeError):
+            return None
         
-    @lru_cache(maxsize=100)
-    def get_dataset_stats(self, dataset_id: str) -> Optional[DatasetStats]:
+        with self._cache_lock:
+            self._stats_cache[dataset_id] = stats
+        return stats
+    
+    def _store_stats(self, stats_list: List[DatasetStats], verbose: bool = True):
+        """Cache stats in memory and write them to disk in one transaction"""
+        with self._cache_lock:
+            for stats in stats_list:
+                self._stats_cache[stats.id] = stats
+        if self._disk is None or not stats_list:
+            return
+        
+        now = time.time()
+        rows = [(stats.id, now, json.dumps(_stats_to_dict(stats))) for stats in stats_list]
+        try:
+            with self._disk_lock, self._disk:
+                self._disk.executemany("INSERT OR REPLACE INTO stats VALUES (?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            if verbose:
+                print(f"Warning: could not write disk cache: {e}")
+    
+    def clear_cache(self, disk: bool = False):
+        """Drop cached dataset lists and stats so they are refetched (and delete disk rows if `disk`)"""
+        # older disk rows stay on disk for other sessions but are no longer served here
+        self._disk_not_before = time.time()
+        with self._cache_lock:
+            self.cache.clear()
+            self._listing_cache.clear()
+            self._stats_cache.clear()
+        if disk and self._disk is not None:
+            with self._disk_lock, self._disk:
+                self._disk.execute("DELETE FROM stats")
+    
+    def dump_cache(self, path: str) -> int:
+        """Export the disk stats cache to a JSON file (e.g. to share a warm cache)"""
+        if self._disk is None:
+            print("Disk cache is disabled")
+            return 0
+        
+        with self._disk_lock:
+            rows = self._disk.execute("SELECT dataset_id, fetched_at, data FROM stats").fetchall()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({i: {'fetched_at': t, 'stats': json.loads(d)} for i, t, d in rows}, f)
+        return len(rows)
+    
+    def load_cache(self, path: str) -> int:
+        """Import stats written by dump_cache, keeping their original fetch times"""
+        if self._disk is None:
+            print("Disk cache is disabled")
+            return 0
+        
+        with open(path, encoding='utf-8') as f:
+            entries = json.load(f)
+        rows = [(i, e['fetched_at'], json.dumps(e['stats'])) for i, e in entries.items()]
+        with self._disk_lock, self._disk:
+            self._disk.executemany("INSERT OR REPLACE INTO stats VALUES (?, ?, ?)", rows)
+        return len(rows)
+        
+    def _build_stats(self, dataset_id: str, info) -> DatasetStats:
+        """Build DatasetStats from a huggingface_hub DatasetInfo"""
+        return DatasetStats(
+            id=dataset_id,
+            author=dataset_id.split('/')[0] if '/' in dataset_id else 'unknown',
+            name=dataset_id.split('/')[-1],
+            description=getattr(info, 'description', '') or '',
+            downloads=getattr(info, 'downloads', 0) or 0,
+            likes=getattr(info, 'likes', 0) or 0,
+            created_at=getattr(info, 'created_at', datetime.now(timezone.utc)),
+            updated_at=getattr(info, 'last_modified', None) or datetime.now(timezone.utc),
+            tags=tuple(getattr(info, 'tags', None) or ()),
+            url=f"https://huggingface.co/datasets/{dataset_id}",
+            size_bytes=getattr(info, 'size_in_bytes', None),
+            # DatasetInfo always has siblings, but it is None unless the payload listed files
+            file_count=len(info.siblings) if getattr(info, 'siblings', None) is not None else None
+        )
+    
+    def get_dataset_stats(self, dataset_id: str, verbose: bool = True) -> Optional[DatasetStats]:
         """Get comprehensive dataset statistics"""
         try:
-            # Check cache first
-            if dataset_id in self._stats_cache:
-                cache_time, stats = self._stats_cache[dataset_id]
-                if time.time() - cache_time < self.cache_timeout:
-                    return stats
+            # Check cache first (memory, then disk)
+            stats = self._lookup_stats(dataset_id)
+            if stats:
+                return stats
             
             # Get basic dataset info
-            info = dataset_info(dataset_id)
+            info = DatasetInfo(**self._hub_get(f"{HF_ENDPOINT}/api/datasets/{dataset_id}"))
             
             # Extract available information
-            stats = DatasetStats(
-                id=dataset_id,
-                author=dataset_id.split('/')[0] if '/' in dataset_id else 'unknown',
-                name=dataset_id.split('/')[-1],
-                description=getattr(info, 'description', '') or '',
-                downloads=getattr(info, 'downloads', 0) or 0,
-                likes=getattr(info, 'likes', 0) or 0,
-                created_at=getattr(info, 'created_at', datetime.now()),
-                updated_at=getattr(info, 'last_modified', datetime.now()) or datetime.now(),
-                tags=getattr(info, 'tags', []) or [],
-                url=f"https://huggingface.co/datasets/{dataset_id}",
-                size_bytes=getattr(info, 'size_in_bytes', None),
-                file_count=len(getattr(info, 'siblings', [])) if hasattr(info, 'siblings') else None
-            )
+            stats = self._build_stats(dataset_id, info)
             
             # Cache the result
-            self._stats_cache[dataset_id] = (time.time(), stats)
+            self._store_stats([stats], verbose)
             return stats
             
         except Exception as e:
-            print(f"Error fetching stats for {dataset_id}: {e}")
+            if verbose:
+                print(f"Error fetching stats for {dataset_id}: {e}")
             return None
     
+    # UI sort option -> hub sort key (the hub returns results already ordered)
+    SORT_KEYS = {
+        'downloads': 'downloads',
+        'likes': 'likes',
+        'updated': 'lastModified',
+        'created': 'createdAt'
+    }
+    
+    def _note_rate_limit(self, headers):
+        """Pause new requests until the window resets once the hub reports no remaining quota"""
+        if headers.get('X-RateLimit-Remaining') == '0':
+            try:
+                reset = float(headers.get('X-RateLimit-Reset', 1))
+            except ValueError:
+                reset = 1.0
+            self._paused_until = time.monotonic() + min(reset, MAX_RETRY_DELAY)
+    
+    def _hub_response(self, url: str, **kwargs) -> 'requests.Response':
+        """GET a hub API URL over the shared session, retrying 429/503"""
+        for attempt in range(self.max_retries + 1):
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                time.sleep(pause)
+            resp = self.session.get(url, timeout=30, **kwargs)
+            self._note_rate_limit(resp.headers)
+            if resp.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                time.sleep(_retry_delay(resp.headers, attempt))
+                continue
+            resp.raise_for_status()
+            return resp
+    
+    def _hub_get(self, url: str, **kwargs) -> Any:
+        """GET a hub API URL and return its JSON (see _hub_response)"""
+        return self._hub_response(url, **kwargs).json()
+    
+    async def _hub_request(self, session, semaphore, url: str, **kwargs) -> Any:
+        """Async counterpart of _hub_get on an aiohttp session, bounded by `semaphore`"""
+        for attempt in range(self.max_retries + 1):
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+            async with semaphore:
+                async with session.get(url, **kwargs) as resp:
+                    self._note_rate_limit(resp.headers)
+                    if resp.status not in RETRY_STATUSES or attempt == self.max_retries:
+                        resp.raise_for_status()
+                        return await resp.json()
+                    delay = _retry_delay(resp.headers, attempt)
+            # back off outside the semaphore so other requests can proceed
+            await asyncio.sleep(delay)
+    
+    def _list_datasets_page(self, sort_by: str, limit: int) -> List[Any]:
+        """Fetch one sorted page of datasets, with all fields, in a single /api/datasets request"""
+        items = self._hub_get(
+            f"{HF_ENDPOINT}/api/datasets",
+            params={
+                'full': 'true',
+                'limit': limit,
+                'sort': self.SORT_KEYS.get(sort_by, 'downloads'),
+                'direction': -1
+            }
+        )
+        return [DatasetInfo(**item) for item in items]
+    
+    def _list_datasets_fallback(self, sort_by: str, limit: int) -> List[Any]:
+        """Sorted listing through huggingface_hub with backoff, then manual cursor pagination"""
+        sort = self.SORT_KEYS.get(sort_by, 'downloads')
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    # the hub sorts descending; huggingface_hub 2.x has no direction argument
+                    return list(list_datasets(limit=limit, sort=sort, full=True))
+                except HfHubHTTPError as e:
+                    response = getattr(e, 'response', None)
+                    if (getattr(response, 'status_code', None) not in RETRY_STATUSES
+                            or attempt == self.max_retries):
+                        raise
+                    time.sleep(_retry_delay(response.headers, attempt))
+        except (json.JSONDecodeError, requests.exceptions.JSONDecodeError):
+            # huggingface_hub's paginator choked on a page; follow the Link headers ourselves
+            return self._list_datasets_paginated(sort, limit)
+    
+    def _list_datasets_paginated(self, sort: str, limit: int) -> List[Any]:
+        """Walk /api/datasets page by page via the `Link: rel="next"` cursor until `limit` entries"""
+        items = []
+        url = f"{HF_ENDPOINT}/api/datasets"
+        params = {'full': 'true', 'sort': sort, 'direction': -1}
+        while url and len(items) < limit:
+            resp = self._hub_response(url, params=params)
+            items.extend(resp.json())
+            url = resp.links.get('next', {}).get('url')
+            params = None  # the next URL carries the cursor and query
+        return [DatasetInfo(**item) for item in items[:limit]]
+    
+    # DatasetInfo attributes that must be present to skip the per-dataset dataset_info call
+    _LISTING_FIELDS = ('downloads', 'likes', 'tags', 'created_at', 'last_modified')
+    
+    def _stats_from_listing(self, infos, verbose: bool = True) -> List[Optional[DatasetStats]]:
+        """Build stats from list_datasets entries, fetching details only for incomplete ones"""
+        stats = []
+        for info in infos:
+            if all(getattr(info, f, None) is not None for f in self._LISTING_FIELDS):
+                stats.append(self._build_stats(info.id, info))
+            else:
+                stats.append(None)
+        self._store_stats([s for s in stats if s], verbose)
+        
+        missing = [i for i, s in enumerate(stats) if s is None]
+        for i, fetched in zip(missing, self.get_many_dataset_stats([infos[i].id for i in missing], verbose)):
+            stats[i] = fetched
+        return stats
+    
+    async def _fetch_stats_async(self, session, semaphore, dataset_id: str,
+                                 verbose: bool = True) -> Optional[DatasetStats]:
+        """Fetch dataset stats over a shared aiohttp session, retrying rate-limited requests"""
+        stats = self._lookup_stats(dataset_id)
+        if stats:
+            return stats
+        
+        try:
+            data = await self._hub_request(session, semaphore, f"{HF_ENDPOINT}/api/datasets/{dataset_id}")
+            stats = self._build_stats(dataset_id, DatasetInfo(**data))
+            self._store_stats([stats], verbose)
+            return stats
+        except Exception as e:
+            if verbose:
+                print(f"Error fetching stats for {dataset_id}: {e}")
+        return None
+    
+    async def _get_popular_async(self, dataset_ids: List[str], verbose: bool = True) -> List[Optional[DatasetStats]]:
+        """Fetch stats for all ids concurrently, at most concurrency_limit requests at a time"""
+        semaphore = asyncio.Semaphore(self.concurrency_limit)
+        token = get_token()
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            return await asyncio.gather(*[self._fetch_stats_async(session, semaphore, i, verbose)
+                                          for i in dataset_ids])
+    
+    def get_many_dataset_stats(self, dataset_ids: List[str], verbose: bool = True) -> List[Optional[DatasetStats]]:
+        """Get stats for several datasets concurrently (aiohttp, else a thread pool)"""
+        if AIOHTTP_AVAILABLE:
+            return _run_async(self._get_popular_async(dataset_ids, verbose))
+        # requests releases the GIL while waiting on sockets, so threads overlap the I/O
+        with ThreadPoolExecutor(max_workers=self.concurrency_limit) as executor:
+            return list(executor.map(self.get_dataset_stats, dataset_ids, [verbose] * len(dataset_ids)))
+    
+    def _get_listing(self, sort_by: str, fetch_limit: int) -> List[Any]:
+        """First `fetch_limit` hub entries for `sort_by`, reusing a cached listing at least that long"""
+        with self._cache_lock:
+            entry = self._listing_cache.get(sort_by)
+        if entry is not None and entry[0] >= fetch_limit:
+            return entry[1][:fetch_limit]
+        
+        try:
+            infos = self._list_datasets_page(sort_by, fetch_limit)
+        except (requests.HTTPError, ValueError):
+            # bad status or undecodable page; connection errors and timeouts were already
+            # retried by the session and go straight to the caller
+            infos = self._list_datasets_fallback(sort_by, fetch_limit)
+        infos = list(islice(infos, fetch_limit))  # never drain an unbounded iterator
+        with self._cache_lock:
+            self._listing_cache[sort_by] = (fetch_limit, infos)
+        return infos
+    
+    def is_cached(self, time_period: str = 'all', limit: int = 50, sort_by: str = 'downloads') -> bool:
+        """Whether get_popular_datasets would answer these filters from the cache"""
+        with self._cache_lock:
+            return f"{time_period}_{limit}_{sort_by}" in self.cache
+    
     def get_popular_datasets(self, 
                            time_period: str = 'all',
                            limit: int = 50,
-                           sort_by: str = 'downloads') -> List[DatasetStats]:
+                           sort_by: str = 'downloads',
+                           verbose: bool = True) -> List[DatasetStats]:
         """Get popular datasets with filtering"""
         
         cache_key = f"{time_period}_{limit}_{sort_by}"
         
         # Check cache
-        if cache_key in self.cache:
-            cache_time, data = self.cache[cache_key]
-            if time.time() - cache_time < self.cache_timeout:
-                return data
+        with self._cache_lock:
+            data = self.cache.get(cache_key)
+        if data is not None:
+            return data
         
         try:
             # Fetch datasets from HuggingFace
-            print(f"🔍 Fetching {limit} datasets from HuggingFace Hub...")
+            if verbose:
+                print(f"🔍 Fetching {limit} datasets from HuggingFace Hub...")
             
-            # Get dataset list - try with sort parameter if available
-            try:
-                # Try to get more datasets to have better filtering options
-                datasets = list_datasets(limit=limit * 3)
-            except Exception:
-                datasets = list_datasets()  # Fallback without parameters
+            # Get dataset list, already sorted by the hub; full=true embeds
+            # downloads, likes, tags and dates, so no per-dataset calls are needed.
+            # The hub cannot filter by date, so time windows get some headroom
+            # for entries the time filter drops
+            fetch_limit = limit if time_period == 'all' else min(limit * 2, 500)
+            datasets = self._get_listing(sort_by, fetch_limit)
             
-            # Convert to DatasetStats objects with progress indication
-            dataset_stats = []
+            # Convert to DatasetStats objects and apply time filtering (order comes
+            # from the hub), one batch of `limit` listing entries at a time
+            filtered_stats = []
             processed = 0
             
-            for dataset in datasets:
-                if len(dataset_stats) >= limit:
-                    break
-                    
-                stats = self.get_dataset_stats(dataset.id)
-                if stats:
-                    dataset_stats.append(stats)
-                
-                processed += 1
-                # Progress indicator every 20 datasets
-                if processed % 20 == 0:
-                    print(f"  📊 Processed {processed} datasets, found {len(dataset_stats)} with valid stats...")
-            
-            # Apply filtering and sorting
-            filtered_stats = self._apply_filters(dataset_stats, time_period, sort_by)
+            while len(filtered_stats) < limit and processed < len(datasets):
+                batch = datasets[processed:processed + limit]
+                batch_stats = [s for s in self._stats_from_listing(batch, verbose) if s]
+                filtered_stats.extend(self._apply_filters(batch_stats, time_period))
+                processed += len(batch)
+                if verbose:
+                    print(f"  📊 Processed {processed} datasets, found {len(filtered_stats)} matching...")
             
             # Cache results
-            self.cache[cache_key] = (time.time(), filtered_stats[:limit])
+            with self._cache_lock:
+                self.cache[cache_key] = filtered_stats[:limit]
             
-            print(f"✅ Found {len(filtered_stats[:limit])} datasets matching criteria")
+            if verbose:
+                print(f"✅ Found {len(filtered_stats[:limit])} datasets matching criteria")
             return filtered_stats[:limit]
             
         except Exception as e:
-            print(f"❌ Error fetching datasets: {e}")
+            if verbose:
+                print(f"❌ Error fetching datasets: {e}")
             return []
     
     def _apply_filters(self, 
                       datasets: List[DatasetStats], 
-                      time_period: str, 
-                      sort_by: str) -> List[DatasetStats]:
-        """Apply time and sorting filters"""
+                      time_period: str) -> List[DatasetStats]:
+        """Apply time filters"""
         
         # Time filtering
         if time_period != 'all':
-            cutoff_date = datetime.now()
+            cutoff_date = datetime.now(timezone.utc)
             if time_period == '7d':
                 cutoff_date -= timedelta(days=7)
             elif time_period == '30d':
@@ -334,29 +758,127 @@ class DatasetManager:
                 cutoff_date -= timedelta(days=90)
             
             # Filter by update date as proxy for recent activity
-            datasets = [d for d in datasets if d.updated_at >= cutoff_date]
-        
-        # Sorting
-        if sort_by == 'downloads':
-            datasets.sort(key=lambda x: x.downloads, reverse=True)
-        elif sort_by == 'likes':
-            datasets.sort(key=lambda x: x.likes, reverse=True)
-        elif sort_by == 'updated':
-            datasets.sort(key=lambda x: x.updated_at, reverse=True)
-        elif sort_by == 'created':
-            datasets.sort(key=lambda x: x.created_at, reverse=True)
+            if NUMPY_AVAILABLE and len(datasets) > 64:
+                updated = np.fromiter((d.updated_at.timestamp() for d in datasets),
+                                      dtype=np.float64, count=len(datasets))
+                datasets = [datasets[i] for i in np.flatnonzero(updated >= cutoff_date.timestamp())]
+            else:
+                datasets = [d for d in datasets if d.updated_at >= cutoff_date]
         
         return datasets
 
+# Details panel markup, defined once at module level and filled per dataset by
+# _render_details_html (whose lru_cache is what makes re-selection cheap)
+_TAG_HTML = '<span style="background: #e3f2fd; color: #1976d2; padding: 2px 6px; margin: 2px; border-radius: 3px; font-size: 12px;">{}</span> '
+_DETAILS_TEMPLATE = string.Template("""
+        <div style="font-family: Arial, sans-serif; padding: 20px; background: white; border-radius: 10px;">
+            <div style="border-bottom: 2px solid #007bff; padding-bottom: 15px; margin-bottom: 20px;">
+                <h3 style="margin: 0; color: #007bff;">📊 $author/$name</h3>
+                <p style="margin: 5px 0 0 0; color: #6c757d; font-size: 14px;">Dataset Details & Statistics</p>
+            </div>
+            
+            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin-bottom: 20px;">
+                <div style="background: #f8f9fa; padding: 15px; border-radius: 8px;">
+                    <h4 style="margin: 0 0 10px 0; color: #2c3e50;">📈 Statistics</h4>
+                    <div style="line-height: 1.6;">
+                        <strong>Downloads:</strong> <span style="color: #28a745; font-weight: bold;">$downloads</span><br>
+                        <strong>Likes:</strong> <span style="color: #ffc107; font-weight: bold;">❤️ $likes</span><br>
+                        <strong>Files:</strong> $file_count<br>
+                        <strong>Size:</strong> $size
+                    </div>
+                </div>
+                
+                <div style="background: #f8f9fa; padding: 15px; border-radius: 8px;">
+                    <h4 style="margin: 0 0 10px 0; color: #2c3e50;">📅 Timeline</h4>
+                    <div style="line-height: 1.6;">
+                        <strong>Created:</strong> $created<br>
+                        <strong>Updated:</strong> $updated
+                    </div>
+                </div>
+            </div>
+            
+            <div style="margin: 20px 0;">
+                <h4 style="margin: 0 0 10px 0; color: #2c3e50;">🏷️ Tags</h4>
+                <div style="line-height: 1.8;">
+                    $tags
+                </div>
+            </div>
+            
+            <div style="margin: 20px 0;">
+                <h4 style="margin: 0 0 10px 0; color: #2c3e50;">📝 Description</h4>
+                <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; max-height: 120px; overflow-y: auto; line-height: 1.5;">
+                    $description
+                </div>
+            </div>
+            
+            <div style="margin: 20px 0 0 0; text-align: center;">
+                <a href="$url" target="_blank" 
+                   style="display: inline-block; background: #007bff; color: white; padding: 12px 24px; 
+                          text-decoration: none; border-radius: 6px; font-weight: bold; 
+                          transition: background 0.3s;">
+                    🤗 View on HuggingFace Hub
+                </a>
+            </div>
+        </div>
+        """)
+
+@lru_cache(maxsize=256)
+def _render_details_html(dataset: DatasetStats) -> str:
+    """Details panel HTML for a dataset, memoized so re-selecting it is free"""
+    
+    # Format file size
+    size_str = "Unknown"
+    if dataset.size_bytes:
+        if dataset.size_bytes > 1e9:
+            size_str = f"{dataset.size_bytes / 1e9:.1f} GB"
+        elif dataset.size_bytes > 1e6:
+            size_str = f"{dataset.size_bytes / 1e6:.1f} MB"
+        else:
+            size_str = f"{dataset.size_bytes / 1e3:.1f} KB"
+    
+    # Format dates
+    created_str = dataset.created_at.strftime('%Y-%m-%d') if dataset.created_at else 'Unknown'
+    
+    # Create details HTML
+    return _DETAILS_TEMPLATE.substitute(
+        author=dataset.author,
+        name=dataset.name,
+        downloads=format(dataset.downloads, ',d'),
+        likes=dataset.likes,
+        file_count=dataset.file_count or 'Unknown',
+        size=size_str,
+        created=created_str,
+        updated=dataset.updated_str,
+        tags=dataset.tags_html,
+        description=dataset.description or '<i style="color: #999;">No description available for this dataset.</i>',
+        url=dataset.url,
+    )
+
 class DatasetViewer:
     """Main class that orchestrates the complete dataset viewer"""
     
-    def __init__(self):
+    # buttons rendered at once; every widget is a separate comm to the kernel
+    page_size = 25
+    
+    def __init__(self, prefetch: bool = True):
         if not HF_AVAILABLE:
             raise ImportError("HuggingFace Hub library not available. Please install: pip install huggingface_hub")
             
         self.dataset_manager = DatasetManager()
         self.current_datasets = []
+        self._by_id = {}
+        self.page = 0
+        
+        # Background warming of the list cache for other filter combinations;
+        # _idle is cleared while a user-initiated refresh is running
+        self.prefetch = prefetch
+        self._idle = threading.Event()
+        self._idle.set()
+        self._prefetch_queue = queue.PriorityQueue()
+        self._prefetch_gen = 0
+        if prefetch:
+            threading.Thread(target=self._prefetch_worker, daemon=True).start()
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -366,6 +888,15 @@ class DatasetViewer:
         # Create dataset button box (initially empty)
         self.dataset_buttonbox = ButtonBox([], clicker=self.on_dataset_selected)
         
+        # Pager for the button box
+        self.prev_btn = Button(description='◀ Prev', disabled=True, layout=Layout(width='auto'))
+        self.next_btn = Button(description='Next ▶', disabled=True, layout=Layout(width='auto'))
+        self.page_label = HTML()
+        self.prev_btn.on_click(lambda b: self.show_page(self.page - 1))
+        self.next_btn.on_click(lambda b: self.show_page(self.page + 1))
+        self.pager = HBox([self.prev_btn, self.page_label, self.next_btn],
+                          layout=Layout(align_items='center', margin='5px 0'))
+        
         # Create details display
         self.details_panel = widgets.HTML(
             value='''
@@ -385,6 +916,7 @@ class DatasetViewer:
             HTML('<h3 style="color: #2c3e50; margin: 20px 0 10px 0;">📊 Popular Datasets</h3>'),
             HTML('<div style="margin-bottom: 10px; color: #6c757d; font-size: 14px;">Click on any dataset below to view detailed information:</div>'),
             self.dataset_buttonbox.box,
+            self.pager,
             self.details_panel
         ])
         
@@ -393,15 +925,45 @@ class DatasetViewer:
     
     def on_filters_changed(self, filter_values, force_refresh=False):
         """Handle filter changes"""
-        if force_refresh or not self.current_datasets:
+        if force_refresh:
+            self.dataset_manager.clear_cache()
+        if force_refresh or not self.current_datasets or self.dataset_manager.is_cached(**filter_values):
             self.refresh_datasets(filter_values)
     
+    def _schedule_prefetch(self, filter_values):
+        """Queue the filter combinations one change away from the current ones"""
+        self._prefetch_gen += 1  # drops entries queued for earlier filters
+        options = [[value for _, value in w.options]
+                   for w in (self.filters.time_filter, self.filters.limit_filter, self.filters.sort_filter)]
+        current = (filter_values['time_period'], filter_values['limit'], filter_values['sort_by'])
+        for seq, combo in enumerate(product(*options)):
+            if sum(a != b for a, b in zip(combo, current)) == 1:
+                # larger limits first: their listings also cover the smaller ones
+                self._prefetch_queue.put((-combo[1], seq, self._prefetch_gen, combo))
+    
+    def _prefetch_worker(self):
+        while True:
+            _, _, gen, combo = self._prefetch_queue.get()
+            if combo is None:  # sentinel from close()
+                return
+            self._idle.wait()  # user-initiated refreshes go first
+            if gen != self._prefetch_gen or self.dataset_manager.is_cached(*combo):
+                continue
+            self.dataset_manager.get_popular_datasets(*combo, verbose=False)
+    
+    def close(self):
+        """Stop the prefetch thread"""
+        self._prefetch_gen += 1
+        self._prefetch_queue.put((float('-inf'), 0, self._prefetch_gen, None))
+        self._idle.set()
+    
     def refresh_datasets(self, filter_values=None):
         """Refresh the dataset list"""
         if not filter_values:
             filter_values = self.filters.get_filter_values()
         
         self.filters.set_loading(True)
+        self._idle.clear()
         
         # Clear current display
         self.dataset_buttonbox.clear()
@@ -422,6 +984,8 @@ class DatasetViewer:
             
             self.current_datasets = datasets
             self.update_dataset_display()
+            if self.prefetch:
+                self._schedule_prefetch(filter_values)
             
         except Exception as e:
             self.details_panel.value = f'''
@@ -433,11 +997,12 @@ class DatasetViewer:
             '''
         finally:
             self.filters.set_loading(False)
+            self._idle.set()
     
     def update_dataset_display(self):
         """Update the ButtonBox with current datasets"""
-        # Clear existing buttons
-        self.dataset_buttonbox.clear()
+        self._by_id = {d.id: d for d in self.current_datasets}
+        self.show_page(0)
         
         if not self.current_datasets:
             self.details_panel.value = '''
@@ -448,27 +1013,6 @@ class DatasetViewer:
             </div>
             '''
             return
-        
-        # Add dataset buttons
-        for i, dataset in enumerate(self.current_datasets):
-            # Format download count
-            download_str = f"{dataset.downloads:,}" if dataset.downloads > 0 else "N/A"
-            
-            # Create button text with ranking
-            button_text = f"#{i+1} {dataset.name} ({download_str} downloads)"
-            
-            # Create comprehensive tooltip
-            tooltip = f"""Dataset: {dataset.author}/{dataset.name}
-Downloads: {download_str}
-Likes: {dataset.likes}
-Tags: {', '.join(dataset.tags[:5]) if dataset.tags else 'None'}
-Updated: {dataset.updated_at.strftime('%Y-%m-%d') if dataset.updated_at else 'Unknown'}
-Description: {dataset.description[:150] if dataset.description else 'No description available'}..."""
-            
-            # Add button with dataset info
-            btn = self.dataset_buttonbox.append(button_text, select=False)
-            btn.tooltip = tooltip
-            btn.dataset_id = dataset.id  # Store dataset reference
             
         # Update success message
         self.details_panel.value = f'''
@@ -478,95 +1022,65 @@ Description: {dataset.description[:150] if dataset.description else 'No descript
         </div>
         '''
     
+    def show_page(self, page):
+        """Show one page of dataset buttons"""
+        pages = max(1, -(-len(self.current_datasets) // self.page_size))
+        self.page = max(0, min(page, pages - 1))
+        start = self.page * self.page_size
+        
+        # Clear existing buttons
+        self.dataset_buttonbox.clear()
+        
+        # Add dataset buttons
+        page_datasets = self.current_datasets[start:start + self.page_size]
+        button_texts, tooltips = [], []
+        for i, dataset in enumerate(page_datasets, start + 1):
+            # Create button text with ranking
+            download_str = dataset.download_str
+            button_texts.append(f"#{i} {dataset.name} ({download_str} downloads)")
+            
+            # Create comprehensive tooltip
+            tooltips.append("\n".join((
+                "Dataset: " + dataset.author + "/" + dataset.name,
+                "Downloads: " + download_str,
+                "Likes: " + str(dataset.likes),
+                "Tags: " + dataset._tag_summary,
+                "Updated: " + dataset.updated_str,
+                "Description: " + (dataset.description[:150] if dataset.description else 'No description available') + "...",
+            )))
+        
+        # Add buttons with dataset info in one widget update
+        for btn, dataset in zip(self.dataset_buttonbox.extend(button_texts, tooltips), page_datasets):
+            btn.dataset_id = dataset.id  # Store dataset reference
+        
+        # Update pager
+        self.prev_btn.disabled = self.page == 0
+        self.next_btn.disabled = self.page >= pages - 1
+        self.page_label.value = f'<span style="margin: 0 10px; color: #6c757d;">Page {self.page + 1} / {pages}</span>'
+    
     def on_dataset_selected(self, buttonbox):
         """Handle dataset selection"""
         if buttonbox.button and hasattr(buttonbox.button, 'dataset_id'):
             dataset_id = buttonbox.button.dataset_id
-            dataset = next((d for d in self.current_datasets if d.id == dataset_id), None)
+            dataset = self._by_id.get(dataset_id)
             
             if dataset:
                 self.display_dataset_details(dataset)
     
     def display_dataset_details(self, dataset: DatasetStats):
         """Display detailed information for selected dataset"""
-        
-        # Format file size
-        size_str = "Unknown"
-        if dataset.size_bytes:
-            if dataset.size_bytes > 1e9:
-                size_str = f"{dataset.size_bytes / 1e9:.1f} GB"
-            elif dataset.size_bytes > 1e6:
-                size_str = f"{dataset.size_bytes / 1e6:.1f} MB"
-            else:
-                size_str = f"{dataset.size_bytes / 1e3:.1f} KB"
-        
-        # Format dates
-        created_str = dataset.created_at.strftime('%Y-%m-%d') if dataset.created_at else 'Unknown'
-        updated_str = dataset.updated_at.strftime('%Y-%m-%d') if dataset.updated_at else 'Unknown'
-        
-        # Format tags
-        tags_html = ""
-        if dataset.tags:
-            tags_html = "".join([f'<span style="background: #e3f2fd; color: #1976d2; padding: 2px 6px; margin: 2px; border-radius: 3px; font-size: 12px;">{tag}</span> ' for tag in dataset.tags[:10]])
-        else:
-            tags_html = '<span style="color: #999;">No tags available</span>'
-        
-        # Create details HTML
-        details_html = f"""
-        <div style="font-family: Arial, sans-serif; padding: 20px; background: white; border-radius: 10px;">
-            <div style="border-bottom: 2px solid #007bff; padding-bottom: 15px; margin-bottom: 20px;">
-                <h3 style="margin: 0; color: #007bff;">📊 {dataset.author}/{dataset.name}</h3>
-                <p style="margin: 5px 0 0 0; color: #6c757d; font-size: 14px;">Dataset Details & Statistics</p>
-            </div>
-            
-            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin-bottom: 20px;">
-                <div style="background: #f8f9fa; padding: 15px; border-radius: 8px;">
-                    <h4 style="margin: 0 0 10px 0; color: #2c3e50;">📈 Statistics</h4>
-                    <div style="line-height: 1.6;">
-                        <strong>Downloads:</strong> <span style="color: #28a745; font-weight: bold;">{dataset.downloads:,}</span><br>
-                        <strong>Likes:</strong> <span style="color: #ffc107; font-weight: bold;">❤️ {dataset.likes}</span><br>
-                        <strong>Files:</strong> {dataset.file_count or 'Unknown'}<br>
-                        <strong>Size:</strong> {size_str}
-                    </div>
-                </div>
-                
-                <div style="background: #f8f9fa; padding: 15px; border-radius: 8px;">
-                    <h4 style="margin: 0 0 10px 0; color: #2c3e50;">📅 Timeline</h4>
-                    <div style="line-height: 1.6;">
-                        <strong>Created:</strong> {created_str}<br>
-                        <strong>Updated:</strong> {updated_str}
-                    </div>
-                </div>
-            </div>
-            
-            <div style="margin: 20px 0;">
-                <h4 style="margin: 0 0 10px 0; color: #2c3e50;">🏷️ Tags</h4>
-                <div style="line-height: 1.8;">
-                    {tags_html}
-                </div>
-            </div>
-            
-            <div style="margin: 20px 0;">
-                <h4 style="margin: 0 0 10px 0; color: #2c3e50;">📝 Description</h4>
-                <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; max-height: 120px; overflow-y: auto; line-height: 1.5;">
-                    {dataset.description if dataset.description else '<i style="color: #999;">No description available for this dataset.</i>'}
-                </div>
-            </div>
-            
-            <div style="margin: 20px 0 0 0; text-align: center;">
-                <a href="{dataset.url}" target="_blank" 
-                   style="display: inline-block; background: #007bff; color: white; padding: 12px 24px; 
-                          text-decoration: none; border-radius: 6px; font-weight: bold; 
-                          transition: background 0.3s;">
-                    🤗 View on HuggingFace Hub
-                </a>
-            </div>
-        </div>
-        """
-        
-        self.details_panel.value = details_html
+        self.details_panel.value = _render_details_html(dataset)
 
 # Utility functions for quick access
+_shared_manager: Optional['DatasetManager'] = None
+
+def _get_manager() -> 'DatasetManager':
+    """DatasetManager shared by the utility functions, so its session and caches are reused"""
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = DatasetManager()
+    return _shared_manager
+
 def quick_search_datasets(keyword: str, limit: int = 10) -> List[DatasetStats]:
     """Quick search function for finding datasets by keyword"""
     if not HF_AVAILABLE:
@@ -575,15 +1089,9 @@ def quick_search_datasets(keyword: str, limit: int = 10) -> List[DatasetStats]:
     
     try:
         datasets = list_datasets(search=keyword, limit=limit)
-        manager = DatasetManager()
-        results = []
-        
-        for dataset in datasets:
-            stats = manager.get_dataset_stats(dataset.id)
-            if stats:
-                results.append(stats)
-        
-        return results
+        manager = _get_manager()
+        stats = manager.get_many_dataset_stats([dataset.id for dataset in datasets])
+        return [s for s in stats if s]
     except Exception as e:
         print(f"Error searching datasets: {e}")
         return []
@@ -595,9 +1103,10 @@ def get_top_datasets_by_category(category: str, limit: int = 20) -> List[Dataset
         return []
     
     try:
-        manager = DatasetManager()
+        manager = _get_manager()
         all_datasets = manager.get_popular_datasets(limit=200)
-        filtered = [d for d in all_datasets if category.lower() in [t.lower() for t in d.tags]]
+        category = category.lower()
+        filtered = [d for d in all_datasets if any(t.lower() == category for t in d.tags)]
         return filtered[:limit]
     except Exception as e:
         print(f"Error getting datasets by category: {e}")